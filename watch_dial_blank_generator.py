@@ -17,16 +17,20 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
-import inkex, math, re
+import inkex, math
+from collections import namedtuple
+from functools import lru_cache
 from inkex import Circle, Rectangle, Group
 
-def mm(svg, v): return svg.unittouu(f"{v}mm")
+def mm_scale(svg): return svg.unittouu("1mm")
+
+def fmt(v): return f"{v:.3f}".rstrip("0").rstrip(".")
 
 def center(svg):
     vb = svg.get("viewBox")
     if vb:
-        p = list(map(float, re.split(r"[ ,]+", vb)))
-        return p[0]+p[2]/2, p[1]+p[3]/2
+        x, y, w, h = map(float, vb.replace(",", " ").split())
+        return x+w/2, y+h/2
     return svg.viewport_width/2, svg.viewport_height/2
 
 PRESETS = {
@@ -43,6 +47,20 @@ PRESETS = {
  }
 }
 
+PresetUU = namedtuple("PresetUU", "dial center hands date sub feet")
+
+@lru_cache(maxsize=16)
+def preset_uu(name, scale):
+  """PRESETS[name] with every dimension pre-multiplied by the mm->uu scale."""
+  p=PRESETS[name]
+  def sc(vs): return tuple(v*scale for v in vs)
+  return PresetUU(
+    dial=p["dial"]*scale, center=p["center"]*scale,
+    hands=sc(p["hands"]),
+    date=sc(p["date"]) if "date" in p else None,
+    sub=sc(p["sub"]) if "sub" in p else None,
+    feet=tuple(sc(f) for f in p.get("feet",())))
+
 class BlankDial(inkex.EffectExtension):
   def add_arguments(self,p):
     p.add_argument("--movement_preset",default="nh35")
@@ -59,52 +77,59 @@ class BlankDial(inkex.EffectExtension):
   def effect(self):
     svg=self.svg
     cx,cy=center(svg)
-    preset=PRESETS[self.options.movement_preset]
+    k=mm_scale(svg)
+    def mm(v): return v*k
+    preset=preset_uu(self.options.movement_preset,k)
     g=Group(); g.label=self.options.group_name
-    svg.get_current_layer().add(g)
 
     def add(el): g.add(el)
 
     if self.options.draw_outline:
-      r=preset["dial"]/2
+      r=preset.dial/2
       if self.options.compensate_outline:
-        r-=self.options.outline_stroke_mm/2
-      c=Circle(); c.center=(cx,cy); c.radius=mm(svg,r)
-      c.style={"fill":"none","stroke":"#777","stroke-width":str(mm(svg,self.options.outline_stroke_mm))}
+        r-=mm(self.options.outline_stroke_mm)/2
+      c=Circle(); c.set("cx",fmt(cx)); c.set("cy",fmt(cy)); c.set("r",fmt(r))
+      c.style={"fill":"none","stroke":"#777","stroke-width":fmt(mm(self.options.outline_stroke_mm))}
       add(c)
 
     if self.options.draw_center_hole:
-      c=Circle(); c.center=(cx,cy); c.radius=mm(svg,preset["center"]/2)
-      c.style={"fill":"none","stroke":"#777","stroke-width":str(mm(svg,0.1))}
+      c=Circle(); c.set("cx",fmt(cx)); c.set("cy",fmt(cy)); c.set("r",fmt(preset.center/2))
+      c.style={"fill":"none","stroke":"#777","stroke-width":fmt(mm(0.1))}
       add(c)
 
     if self.options.draw_hand_holes:
-      for d in preset["hands"]:
-        c=Circle(); c.center=(cx,cy); c.radius=mm(svg,d/2)
-        c.style={"fill":"none","stroke":"#999","stroke-width":str(mm(svg,0.08))}
+      st=f"fill:none;stroke:#999;stroke-width:{fmt(mm(0.08))}"
+      for d in preset.hands:
+        c=Circle(); c.set("cx",fmt(cx)); c.set("cy",fmt(cy)); c.set("r",fmt(d/2))
+        c.attrib["style"]=st
         add(c)
 
     if self.options.movement_preset=="nh35" and self.options.draw_date_window:
-      w,h,r=preset["date"]
+      w,h,r=preset.date
       rect=Rectangle()
-      rect.set("x",str(cx+mm(svg,r)-mm(svg,w/2)))
-      rect.set("y",str(cy-mm(svg,h/2)))
-      rect.set("width",str(mm(svg,w)))
-      rect.set("height",str(mm(svg,h)))
-      rect.style={"fill":"none","stroke":"#777","stroke-width":str(mm(svg,0.1))}
+      rect.set("x",fmt(cx+r-w/2))
+      rect.set("y",fmt(cy-h/2))
+      rect.set("width",fmt(w))
+      rect.set("height",fmt(h))
+      rect.style={"fill":"none","stroke":"#777","stroke-width":fmt(mm(0.1))}
       add(rect)
 
     if self.options.movement_preset=="st36" and self.options.draw_subdial:
-      x,y=preset["sub"]
-      c=Circle(); c.center=(cx-mm(svg,x),cy); c.radius=mm(svg,6.0)
-      c.style={"fill":"none","stroke":"#777","stroke-width":str(mm(svg,0.1))}
+      x,y=preset.sub
+      c=Circle(); c.set("cx",fmt(cx-x)); c.set("cy",fmt(cy)); c.set("r",fmt(mm(6.0)))
+      c.style={"fill":"none","stroke":"#777","stroke-width":fmt(mm(0.1))}
       add(c)
 
-    if self.options.draw_dial_feet and "feet" in preset:
-      for x,y in preset["feet"]:
-        c=Circle(); c.center=(cx+mm(svg,x),cy+mm(svg,y)); c.radius=mm(svg,0.5)
-        c.style={"fill":"none","stroke":"#aaa","stroke-width":str(mm(svg,0.08))}
+    if self.options.draw_dial_feet and preset.feet:
+      st=f"fill:none;stroke:#aaa;stroke-width:{fmt(mm(0.08))}"
+      for x,y in preset.feet:
+        c=Circle(); c.set("cx",fmt(cx+x)); c.set("cy",fmt(cy+y)); c.set("r",fmt(mm(0.5)))
+        c.attrib["style"]=st
         add(c)
 
+    # attach once, after the group is fully built; skip it if every draw_* was off
+    if len(g):
+      svg.get_current_layer().add(g)
+
 if __name__=="__main__":
   BlankDial().run()
\ No newline at end of file
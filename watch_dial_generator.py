@@ -25,7 +25,7 @@ Problem:
   converting mm->px using 96dpi makes everything ~3.78x too large (28.5mm -> ~108mm).
 
 Fix:
-- Convert mm to *document user units* using svg.unittouu(f"{mm}mm").
+- Convert mm to *document user units* using svg.unittouu("1mm") (queried once per run).
   This adapts correctly whether the document uses px, mm, etc.
 
 Keeps:
@@ -34,12 +34,16 @@ Keeps:
 - Omit 3 for date window
 - Tuning options (offsets, baseline, orientation)
 - Marker/tick alignment options
+- Hour markers / minute ticks emitted as <use> clones of <defs> templates
 - Robust center detection (no svg.viewbox dependency)
 """
 
-import math
 import csv
-import re
+import functools
+import math
+from xml.sax.saxutils import quoteattr
+
+import numpy as np
 
 import inkex
 from inkex import Circle, Rectangle, TextElement, Group
@@ -48,9 +52,10 @@ from inkex import Circle, Rectangle, TextElement, Group
 def get_doc_center(svg):
     vb = svg.get("viewBox") or svg.get("viewbox")
     if vb:
-        parts = [p for p in re.split(r"[ ,]+", vb.strip()) if p]
+        # viewBox values are separated by whitespace and/or commas
+        parts = vb.replace(",", " ").split()
         if len(parts) == 4:
-            minx, miny, w, h = [float(p) for p in parts]
+            minx, miny, w, h = map(float, parts)
             return (minx + w / 2.0, miny + h / 2.0)
     try:
         w = svg.unittouu(svg.get("width") or "0")
@@ -62,34 +67,56 @@ def get_doc_center(svg):
     return (0.0, 0.0)
 
 
-def mm_to_uu(svg, mm: float) -> float:
-    """Convert millimeters to the document's user units."""
+def uu_per_mm(svg) -> float:
+    """Return the number of document user units in one millimeter."""
     try:
-        return float(svg.unittouu(f"{mm}mm"))
+        return float(svg.unittouu("1mm"))
     except Exception:
         # Fallback to px @ 96dpi
-        return mm * 96.0 / 25.4
+        return 96.0 / 25.4
+
+
+@functools.lru_cache(maxsize=None)
+def step_table(n: int):
+    """sin/cos of the n evenly spaced angles i * 360/n (30 deg for hours, 6 deg for minutes)."""
+    a = np.arange(n) * (2.0 * math.pi / n)
+    return np.sin(a), np.cos(a)
+
+
+def ring_xy(cx, cy, r, n: int, start_deg: float, direction: float = 1.0):
+    """Positions of n evenly spaced points at clock angles start_deg + i * 360/n.
 
+    The cached step table is rotated by start_deg with the angle-addition
+    identities, so only the start offset needs evaluating. r may be a scalar
+    or an array of n radii; direction is 1.0 for clockwise, -1.0 otherwise.
+    """
+    sin_t, cos_t = step_table(n)
+    a0 = math.radians(start_deg)
+    s0, c0 = math.sin(a0), math.cos(a0)
+    s = direction * (sin_t * c0 + cos_t * s0)
+    c = cos_t * c0 - sin_t * s0
+    return (cx + r * s, cy - r * c)
 
-def polar_to_xy(cx, cy, r, angle_deg_clockwise_from_12):
-    a = math.radians(angle_deg_clockwise_from_12)
-    return (cx + r * math.sin(a), cy - r * math.cos(a))
 
+def _tangent_readable(angle_clock_deg):
+    r = angle_clock_deg % 360.0
+    return r + np.where((r > 90.0) & (r < 270.0), 180.0, 0.0)
 
-def rotation_for_number(mode: str, angle_clock_deg: float) -> float:
+
+# Each entry maps an array of clock angles to an array of label rotations
+NUMBER_ROTATIONS = {
+    "upright": lambda a: np.zeros_like(a),
+    "tangent": lambda a: a,
+    "radial": lambda a: a + 90.0,
+    "tangent_readable": _tangent_readable,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def rotation_for_mode(mode: str):
+    """Return the angles -> label rotations function for a number_orientation mode."""
     mode = (mode or "upright").strip().lower()
-    if mode == "upright":
-        return 0.0
-    if mode == "tangent":
-        return angle_clock_deg
-    if mode == "radial":
-        return angle_clock_deg + 90.0
-    if mode == "tangent_readable":
-        r = angle_clock_deg % 360.0
-        if 90.0 < r < 270.0:
-            r += 180.0
-        return r
-    return 0.0
+    return NUMBER_ROTATIONS.get(mode, NUMBER_ROTATIONS["upright"])
 
 
 def read_labels_from_csv(csv_text: str):
@@ -110,11 +137,50 @@ def read_labels_from_csv(csv_text: str):
     return out
 
 
+def fmt(v: float) -> str:
+    """Format a number for an SVG attribute (3 decimals, trailing zeros dropped)."""
+    return f"{v:.3f}".rstrip("0").rstrip(".")
+
+
 def set_rect_geom(rect: Rectangle, x: float, y: float, w: float, h: float):
-    rect.set("x", str(x))
-    rect.set("y", str(y))
-    rect.set("width", str(w))
-    rect.set("height", str(h))
+    rect.set("x", fmt(x))
+    rect.set("y", fmt(y))
+    rect.set("width", fmt(w))
+    rect.set("height", fmt(h))
+
+
+def add_mark_template(svg, ident: str, w: float, h: float) -> str:
+    """Add a w x h marker centered on the origin to <defs>; return its id for <use> clones."""
+    rect = Rectangle()
+    rect.attrib["style"] = MARK_STYLE
+    set_rect_geom(rect, -w / 2.0, -h / 2.0, w, h)
+    svg.defs.add(rect)
+    if svg.getElementById(ident) is not None:
+        ident = svg.get_unique_id(ident + "-")
+    rect.set("id", ident)
+    return ident
+
+
+def mark_xml(href: str, x: float, y: float, ang: float) -> str:
+    rot = f" rotate({fmt(ang)})" if fmt(ang) != "0" else ""
+    return f'<use xlink:href={quoteattr("#" + href)} transform="translate({fmt(x)},{fmt(y)}){rot}"/>'
+
+
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+
+def append_fragment(g, children_xml):
+    """Parse raw SVG element markup in one go and append the results to g.
+
+    Bypasses per-attribute inkex setters for large batches of simple elements.
+    """
+    frag = inkex.load_svg(
+        f'<g xmlns="http://www.w3.org/2000/svg" xmlns:xlink="{XLINK_NS}">'
+        + "".join(children_xml) + "</g>"
+    ).getroot()
+    g.extend(list(frag))
+    # Moved children each keep their own xmlns:xlink; hoist it to a single declaration on g
+    inkex.etree.cleanup_namespaces(g, top_nsmap={"xlink": XLINK_NS})
 
 
 def aligned_radius(r: float, h: float, align: str) -> float:
@@ -126,9 +192,13 @@ def aligned_radius(r: float, h: float, align: str) -> float:
     return r
 
 
-ARABIC_12_FIRST = ["12", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"]
-ROMAN_12_FIRST_IV  = ["XII", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X", "XI"]
-ROMAN_12_FIRST_IIII = ["XII", "I", "II", "III", "IIII", "V", "VI", "VII", "VIII", "IX", "X", "XI"]
+# Shared by every hour marker and minute tick. Shared style strings are written
+# straight to .attrib, skipping inkex's Style parse/serialize round trip.
+MARK_STYLE = "fill:#000;stroke:none"
+
+ARABIC_12_FIRST = ("12", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11")
+ROMAN_12_FIRST_IV  = ("XII", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X", "XI")
+ROMAN_12_FIRST_IIII = ("XII", "I", "II", "III", "IIII", "V", "VI", "VII", "VIII", "IX", "X", "XI")
 
 
 class WatchDialGenerator(inkex.EffectExtension):
@@ -200,143 +270,117 @@ class WatchDialGenerator(inkex.EffectExtension):
     def effect(self):
         svg = self.document.getroot()
         cx, cy = get_doc_center(svg)
+        mm = uu_per_mm(svg)
+        direction = 1.0 if self.options.clockwise else -1.0
 
+        gid = self.options.group_name or "watch-dial"
         g = Group()
-        g.label = (self.options.group_name or "watch-dial")
-        g.set("id", (self.options.group_name or "watch-dial"))
-        svg.add(g)
+        g.label = gid
+        g.set("id", gid)
 
         stroke_w_mm = self.options.dial_outline_stroke_mm
-        stroke_w = str(mm_to_uu(svg, stroke_w_mm))
+        stroke_w = fmt(stroke_w_mm * mm)
+        outline_style = f"fill:none;stroke:#000;stroke-width:{stroke_w}"
 
         dial_r_mm = (self.options.dial_diameter_mm - (stroke_w_mm if self.options.outline_compensate_stroke else 0.0)) / 2.0
+        dial_r = dial_r_mm * mm
         center_r_mm = (self.options.center_hole_mm - (stroke_w_mm if self.options.outline_compensate_stroke else 0.0)) / 2.0
 
         # Outline
         if self.options.draw_dial_outline:
             c = Circle()
-            c.set("cx", str(cx))
-            c.set("cy", str(cy))
-            c.set("r", str(mm_to_uu(svg, dial_r_mm)))
-            c.style = {"fill": "none", "stroke": "#000", "stroke-width": stroke_w}
+            c.set("cx", fmt(cx))
+            c.set("cy", fmt(cy))
+            c.set("r", fmt(dial_r))
+            c.attrib["style"] = outline_style
             g.add(c)
 
         # Center hole
         if self.options.draw_center_hole:
             h = Circle()
-            h.set("cx", str(cx))
-            h.set("cy", str(cy))
-            h.set("r", str(mm_to_uu(svg, max(0.0, center_r_mm))))
-            h.style = {"fill": "none", "stroke": "#000", "stroke-width": stroke_w}
+            h.set("cx", fmt(cx))
+            h.set("cy", fmt(cy))
+            h.set("r", fmt(max(0.0, center_r_mm) * mm))
+            h.attrib["style"] = outline_style
             g.add(h)
 
         # Hour markers
         if self.options.show_hour_markers:
-            r_base = mm_to_uu(svg, self.options.hour_marker_radius_mm)
-            w = mm_to_uu(svg, self.options.hour_marker_w_mm)
-            hh = mm_to_uu(svg, self.options.hour_marker_h_mm)
+            r_base = self.options.hour_marker_radius_mm * mm
+            w = self.options.hour_marker_w_mm * mm
+            hh = self.options.hour_marker_h_mm * mm
             r = aligned_radius(r_base, hh, self.options.hour_marker_align)
 
-            for i in range(12):
-                ang = (self.options.start_angle_deg + i * 30.0) % 360.0
-                if not self.options.clockwise:
-                    ang = (-ang) % 360.0
-                x, y = polar_to_xy(cx, cy, r, ang)
+            angs = (direction * (self.options.start_angle_deg + np.arange(12) * 30.0)) % 360.0
+            xs, ys = ring_xy(cx, cy, r, 12, self.options.start_angle_deg, direction)
 
-                rect = Rectangle()
-                rect.style = {"fill": "#000", "stroke": "none"}
-                set_rect_geom(rect, x - w / 2.0, y - hh / 2.0, w, hh)
-                rect.set("transform", f"rotate({ang},{x},{y})")
-                g.add(rect)
+            hmark = add_mark_template(svg, gid + "-hmark", w, hh)
+            append_fragment(g, [mark_xml(hmark, x, y, ang)
+                                for ang, x, y in zip(angs.tolist(), xs.tolist(), ys.tolist())])
 
         # Minute ticks
         if self.options.show_minute_ticks:
-            r_base = mm_to_uu(svg, self.options.minute_tick_radius_mm)
-            w = mm_to_uu(svg, self.options.minute_tick_w_mm)
-            h0 = mm_to_uu(svg, self.options.minute_tick_h_mm)
-
-            for i in range(60):
-                ang = (self.options.start_angle_deg + i * 6.0) % 360.0
-                if not self.options.clockwise:
-                    ang = (-ang) % 360.0
+            r_base = self.options.minute_tick_radius_mm * mm
+            w = self.options.minute_tick_w_mm * mm
+            h0 = self.options.minute_tick_h_mm * mm
 
-                scale = self.options.five_minute_scale if (i % 5 == 0) else 1.0
-                hh = h0 * scale
-                r = aligned_radius(r_base, hh, self.options.minute_tick_align)
+            idx = np.arange(60)
+            angs = (direction * (self.options.start_angle_deg + idx * 6.0)) % 360.0
 
-                x, y = polar_to_xy(cx, cy, r, ang)
+            five = idx % 5 == 0
+            hhs = h0 * np.where(five, self.options.five_minute_scale, 1.0)
+            rs = aligned_radius(r_base, hhs, self.options.minute_tick_align)
+            xs, ys = ring_xy(cx, cy, rs, 60, self.options.start_angle_deg, direction)
 
-                rect = Rectangle()
-                rect.style = {"fill": "#000", "stroke": "none"}
-                set_rect_geom(rect, x - w / 2.0, y - hh / 2.0, w, hh)
-                rect.set("transform", f"rotate({ang},{x},{y})")
-                g.add(rect)
+            tick5 = add_mark_template(svg, gid + "-tick5", w, h0 * self.options.five_minute_scale)
+            tick1 = add_mark_template(svg, gid + "-tick1", w, h0)
+            append_fragment(g, [mark_xml(tick5 if is_five else tick1, x, y, ang)
+                                for ang, x, y, is_five in zip(angs.tolist(), xs.tolist(), ys.tolist(), five.tolist())])
 
         # Labels
         if self.options.text_mode == "arabic":
-            labels = list(ARABIC_12_FIRST)
+            labels = ARABIC_12_FIRST
         elif self.options.text_mode == "roman":
-            labels = list(ROMAN_12_FIRST_IIII if (self.options.roman_four_style == "IIII") else ROMAN_12_FIRST_IV)
+            labels = ROMAN_12_FIRST_IIII if (self.options.roman_four_style == "IIII") else ROMAN_12_FIRST_IV
         else:
             labels = read_labels_from_csv(self.options.labels_csv)
 
         if labels:
-            r = mm_to_uu(svg, self.options.text_radius_mm + self.options.text_radial_offset_mm)
-            font_uu = mm_to_uu(svg, self.options.font_size_mm)
-
-            if len(labels) == 12:
-                for i, label in enumerate(labels):
-                    if self.options.omit_three and i == 3:
-                        continue
-
-                    ang = (self.options.start_angle_deg + self.options.text_angle_offset_deg + i * 30.0) % 360.0
-                    if not self.options.clockwise:
-                        ang = (-ang) % 360.0
-
-                    x, y = polar_to_xy(cx, cy, r, ang)
-
-                    t = TextElement()
-                    t.text = label
-                    t.style = {
-                        "font-family": self.options.font_family,
-                        "font-size": str(font_uu),
-                        "text-anchor": "middle",
-                        "dominant-baseline": self.options.text_baseline,
-                    }
-                    t.set("x", str(x))
-                    t.set("y", str(y))
-
-                    rot = rotation_for_number(self.options.number_orientation, ang)
-                    if rot != 0.0:
-                        t.set("transform", f"rotate({rot},{x},{y})")
-
-                    g.add(t)
-            else:
-                n = len(labels)
-                step = 360.0 / float(n)
-                for i, label in enumerate(labels):
-                    ang = (self.options.start_angle_deg + self.options.text_angle_offset_deg + i * step) % 360.0
-                    if not self.options.clockwise:
-                        ang = (-ang) % 360.0
-
-                    x, y = polar_to_xy(cx, cy, r, ang)
-
-                    t = TextElement()
-                    t.text = label
-                    t.style = {
-                        "font-family": self.options.font_family,
-                        "font-size": str(font_uu),
-                        "text-anchor": "middle",
-                        "dominant-baseline": self.options.text_baseline,
-                    }
-                    t.set("x", str(x))
-                    t.set("y", str(y))
-
-                    rot = rotation_for_number(self.options.number_orientation, ang)
-                    if rot != 0.0:
-                        t.set("transform", f"rotate({rot},{x},{y})")
-
-                    g.add(t)
+            r = (self.options.text_radius_mm + self.options.text_radial_offset_mm) * mm
+            font_uu = self.options.font_size_mm * mm
+            rotate = rotation_for_mode(self.options.number_orientation)
+            text_style = (
+                f"font-family:{self.options.font_family};font-size:{fmt(font_uu)};"
+                f"text-anchor:middle;dominant-baseline:{self.options.text_baseline}"
+            )
+
+            n = len(labels)
+            step = 30.0 if n == 12 else 360.0 / float(n)
+            # The date-window helper only applies to a 12-label dial
+            skip = 3 if (self.options.omit_three and n == 12) else -1
+
+            start = self.options.start_angle_deg + self.options.text_angle_offset_deg
+            angs = (direction * (start + np.arange(n) * step)) % 360.0
+            xs, ys = ring_xy(cx, cy, r, n, start, direction)
+            rots = rotate(angs)
+
+            for i, (label, x, y, rot) in enumerate(zip(labels, xs.tolist(), ys.tolist(), rots.tolist())):
+                if i == skip:
+                    continue
+
+                t = TextElement()
+                t.text = label
+                t.attrib["style"] = text_style
+                t.set("x", fmt(x))
+                t.set("y", fmt(y))
+
+                if rot != 0.0:
+                    t.set("transform", f"rotate({fmt(rot)},{fmt(x)},{fmt(y)})")
+
+                g.add(t)
+
+        # Build the group off-tree and attach it once it is fully populated
+        svg.add(g)
 
 
 if __name__ == "__main__":
@@ -30,23 +30,19 @@ Key features:
 - Still supports single-layer generation when Auto complex is off
 
 Compatibility:
-- Uses svg.unittouu("...mm") for correct mm sizing in mm-based docs
-- Avoids inkex.utils.random_string; uses uuid4 for ids
+- Uses svg.unittouu("1mm") (once per run) for correct mm sizing in mm-based docs
+- Avoids inkex.utils.random_string; clip ids are derived from the seed
 """
 
+import functools
 import math
-import re
-import uuid
 import random
 
+import numpy as np
+
 import inkex
 from inkex import Group, Circle
 
-try:
-    from inkex import PathElement
-except Exception:
-    PathElement = None
-
 
 def ensure_defs(svg):
     try:
@@ -63,19 +59,21 @@ def ensure_defs(svg):
     return defs
 
 
-def mm_to_uu(svg, mm: float) -> float:
+def uu_per_mm(svg) -> float:
+    """Return the number of document user units in one millimeter."""
     try:
-        return float(svg.unittouu(f"{mm}mm"))
+        return float(svg.unittouu("1mm"))
     except Exception:
-        return mm * 96.0 / 25.4
+        return 96.0 / 25.4
 
 
 def get_doc_center(svg):
     vb = svg.get("viewBox") or svg.get("viewbox")
     if vb:
-        parts = [p for p in re.split(r"[ ,]+", vb.strip()) if p]
+        # viewBox values are separated by whitespace and/or commas
+        parts = vb.replace(",", " ").split()
         if len(parts) == 4:
-            minx, miny, w, h = [float(p) for p in parts]
+            minx, miny, w, h = map(float, parts)
             return (minx + w / 2.0, miny + h / 2.0)
     try:
         w = svg.unittouu(svg.get("width") or "0")
@@ -87,25 +85,83 @@ def get_doc_center(svg):
     return (0.0, 0.0)
 
 
-def new_path(d: str):
-    if PathElement is not None:
-        p = PathElement()
-    else:
-        p = inkex.etree.Element(inkex.addNS('path', 'svg'))
-    p.set('d', d)
-    return p
+def add_path(parent, d: str, style: str):
+    """Append a <path> straight through lxml, skipping inkex's per-attribute setters."""
+    return inkex.etree.SubElement(parent, inkex.addNS('path', 'svg'), attrib={'d': d, 'style': style})
+
+
+def stroke_style(stroke_color, stroke_w, opacity, extra=None):
+    """Build the CSS for an unfilled stroked shape once, bypassing inkex.Style."""
+    style = "fill:none;stroke:%s;stroke-width:%s;stroke-opacity:%s" % (stroke_color, stroke_w, opacity)
+    return style + ";" + extra if extra else style
+
+
+@functools.lru_cache(maxsize=32)
+def rosette_basis(lobes, points):
+    """sin(t), cos(t) and cos(lobes * t) over points + 1 samples of a full turn.
+
+    Shared by every rosette with the same lobes/points (all bands of a guilloché
+    field, repeated layers), so the trig runs once. Treat the arrays as read-only.
+    """
+    t = np.linspace(0.0, 2.0 * math.pi, points + 1)
+    return np.sin(t), np.cos(t), np.cos(lobes * t)
+
+
+def rosette_xy(cx, cy, base, amplitude, lobes, points, rot_deg=0.0):
+    """Return x and y arrays for a closed rosette of points + 1 samples.
+
+    The radius is base + amplitude * cos(lobes * t), measured clockwise from 12,
+    with the whole rosette turned clockwise by rot_deg about (cx, cy).
+    """
+    rot = math.radians(rot_deg)
+    sin_t, cos_t, wave = rosette_basis(lobes, points)
+    if rot:
+        s0, c0 = math.sin(rot), math.cos(rot)
+        sin_t, cos_t = sin_t * c0 + cos_t * s0, cos_t * c0 - sin_t * s0
+    r = base + amplitude * wave
+    return cx + r * sin_t, cy - r * cos_t
+
+
+# 3 decimals of a user unit is already sub-micron at mm scale
+COORD = "%.3f,%.3f"
+SEGMENT_D = "M " + COORD + " L " + COORD
+RING_D = "M " + COORD + " A " + COORD + " 0 1,0 " + COORD + " A " + COORD + " 0 1,0 " + COORD + " Z"
 
 
-def set_style(el, style_dict):
-    if hasattr(el, 'style'):
-        el.style = style_dict
-    else:
-        el.set('style', inkex.Style(style_dict))
+def interleave(n, *cols):
+    """Pack n rows of the given columns into one flat float array, row by row.
+
+    Columns may be arrays of length n or scalars. Writing into a preallocated
+    buffer keeps the coordinate pipeline in NumPy until the final format step.
+    """
+    k = len(cols)
+    out = np.empty(n * k)
+    for j, col in enumerate(cols):
+        out[j::k] = col
+    return out
 
 
-def polar(cx, cy, r, ang_deg_clockwise_from_12):
-    a = math.radians(ang_deg_clockwise_from_12)
-    return (cx + r * math.sin(a), cy - r * math.cos(a))
+def polyline_d(xs, ys):
+    """Path data for the polyline through (xs[i], ys[i]), formatted in a single pass."""
+    n = len(xs)
+    xy = interleave(n, xs, ys).tolist()
+    return ("M " + COORD + " " + " ".join(["L " + COORD] * (n - 1))) % tuple(xy)
+
+
+def segments_d(x1, y1, x2, y2):
+    """Path data for the independent line segments (x1[i], y1[i]) -> (x2[i], y2[i])."""
+    n = len(x1)
+    xy = interleave(n, x1, y1, x2, y2).tolist()
+    return " ".join([SEGMENT_D] * n) % tuple(xy)
+
+
+def seeded_id(svg, prefix, seed):
+    """Deterministic id for a given seed, skipping any already used in the document."""
+    rnd = random.Random(seed)
+    while True:
+        ident = prefix + "%06x" % rnd.getrandbits(24)
+        if svg.getElementById(ident) is None:
+            return ident
 
 
 def clip_group_to_circle(svg, group, cx, cy, r, clip_id):
@@ -124,44 +180,36 @@ def clip_group_to_circle(svg, group, cx, cy, r, clip_id):
 
 
 def pattern_concentric(svg, g, cx, cy, r_outer, r_inner, spacing, stroke_w, stroke_color, opacity):
-    r = max(0.0, r_inner)
-    while r <= r_outer + 1e-9:
-        c = Circle()
-        c.set('cx', str(cx))
-        c.set('cy', str(cy))
-        c.set('r', str(r))
-        set_style(c, {
-            "fill": "none",
-            "stroke": stroke_color,
-            "stroke-width": str(stroke_w),
-            "stroke-opacity": str(opacity),
-        })
-        g.add(c)
-        r += spacing
-
-
-def pattern_sunburst(svg, g, cx, cy, r_outer, r_inner, rays, stroke_w, stroke_color, opacity):
+    radii = np.arange(max(0.0, r_inner), r_outer + 1e-9, spacing)
+    radii = radii[radii > 0.0]  # a zero-radius ring draws nothing
+    if not len(radii):
+        return
+    # Each ring is a closed subpath of two half-circle arcs, all in one <path>
+    n = len(radii)
+    xr, xl = cx + radii, cx - radii
+    xy = interleave(n, xr, cy, radii, radii, xl, cy, radii, radii, xr, cy).tolist()
+    d = " ".join([RING_D] * n) % tuple(xy)
+    add_path(g, d, stroke_style(stroke_color, stroke_w, opacity))
+
+
+def pattern_sunburst(svg, g, cx, cy, r_outer, r_inner, rays, stroke_w, stroke_color, opacity, clipped=False,
+                     rot_deg=0.0):
+    if clipped and r_inner >= r_outer:
+        return  # every ray lies outside the clip circle
     rays = max(4, int(rays))
-    step = 360.0 / rays
-    for i in range(rays):
-        ang = i * step
-        x1, y1 = polar(cx, cy, r_inner, ang)
-        x2, y2 = polar(cx, cy, r_outer, ang)
-        d = f"M {x1:.6f},{y1:.6f} L {x2:.6f},{y2:.6f}"
-        p = new_path(d)
-        set_style(p, {
-            "fill": "none",
-            "stroke": stroke_color,
-            "stroke-width": str(stroke_w),
-            "stroke-opacity": str(opacity),
-            "stroke-linecap": "round",
-        })
-        g.add(p) if hasattr(g, 'add') else g.append(p)
-
-
-def pattern_crosshatch(svg, g, cx, cy, r_outer, spacing, angle_deg, double, stroke_w, stroke_color, opacity):
+    ang = np.arange(rays) * (2.0 * math.pi / rays) + math.radians(rot_deg)
+    s, c = np.sin(ang), np.cos(ang)
+    # All rays go into one multi-subpath <path>
+    d = segments_d(cx + r_inner * s, cy - r_inner * c, cx + r_outer * s, cy - r_outer * c)
+    add_path(g, d, stroke_style(stroke_color, stroke_w, opacity, "stroke-linecap:round"))
+
+
+def pattern_crosshatch(svg, g, cx, cy, r_outer, spacing, angle_deg, double, stroke_w, stroke_color, opacity,
+                       clipped=False, rot_deg=0.0):
     size = r_outer * 2.2
     half = size / 2.0
+    # Every hatch line (both directions) goes into one multi-subpath <path>
+    segments = []
 
     def add_set(theta_deg):
         theta = math.radians(theta_deg)
@@ -169,58 +217,38 @@ def pattern_crosshatch(svg, g, cx, cy, r_outer, spacing, angle_deg, double, stro
         vx, vy = -uy, ux
 
         count = int((size / spacing)) + 3
-        start = -count // 2
-        end = count // 2 + 1
-        for i in range(start, end):
-            off = i * spacing
-            px = cx + off * vx
-            py = cy + off * vy
-            x1 = px - half * ux
-            y1 = py - half * uy
-            x2 = px + half * ux
-            y2 = py + half * uy
-            d = f"M {x1:.6f},{y1:.6f} L {x2:.6f},{y2:.6f}"
-            p = new_path(d)
-            set_style(p, {
-                "fill": "none",
-                "stroke": stroke_color,
-                "stroke-width": str(stroke_w),
-                "stroke-opacity": str(opacity),
-                "stroke-linecap": "round",
-            })
-            g.add(p) if hasattr(g, 'add') else g.append(p)
-
-    add_set(angle_deg)
+        offs = np.arange(-count // 2, count // 2 + 1) * spacing
+        if clipped:
+            # only emit the visible chord; lines at or beyond r_outer never cross the clip circle
+            offs = offs[np.abs(offs) < r_outer]
+            ext = np.sqrt(np.maximum(r_outer * r_outer - offs * offs, 0.0))
+        else:
+            ext = half
+        px = cx + offs * vx
+        py = cy + offs * vy
+        segments.append(segments_d(px - ext * ux, py - ext * uy, px + ext * ux, py + ext * uy))
+
+    # rotating the hatch direction u also rotates its perpendicular v, and the offsets
+    # along v are unchanged, so a rotation about the center just shifts the angle
+    add_set(angle_deg + rot_deg)
     if double:
-        add_set(angle_deg + 90.0)
+        add_set(angle_deg + rot_deg + 90.0)
+
+    segments = [seg for seg in segments if seg]
+    if segments:
+        add_path(g, " ".join(segments), stroke_style(stroke_color, stroke_w, opacity, "stroke-linecap:round"))
 
 
-def pattern_guilloche(svg, g, cx, cy, r_outer, lobes, amplitude, points, stroke_w, stroke_color, opacity):
+def pattern_guilloche(svg, g, cx, cy, r_outer, lobes, amplitude, points, stroke_w, stroke_color, opacity, rot_deg=0.0):
     lobes = max(2, int(lobes))
     points = max(200, int(points))
     base = max(0.0, r_outer - amplitude)
 
-    pts = []
-    for i in range(points + 1):
-        t = (2.0 * math.pi) * (i / points)
-        r = base + amplitude * math.cos(lobes * t)
-        ang_deg = math.degrees(t)
-        x, y = polar(cx, cy, r, ang_deg)
-        pts.append((x, y))
-
-    d = f"M {pts[0][0]:.6f},{pts[0][1]:.6f} " + " ".join([f"L {x:.6f},{y:.6f}" for x, y in pts[1:]])
-    p = new_path(d)
-    set_style(p, {
-        "fill": "none",
-        "stroke": stroke_color,
-        "stroke-width": str(stroke_w),
-        "stroke-opacity": str(opacity),
-        "stroke-linejoin": "round",
-    })
-    g.add(p) if hasattr(g, 'add') else g.append(p)
+    d = polyline_d(*rosette_xy(cx, cy, base, amplitude, lobes, points, rot_deg))
+    add_path(g, d, stroke_style(stroke_color, stroke_w, opacity, "stroke-linejoin:round"))
 
 def pattern_guilloche_field(svg, g, cx, cy, r_outer, r_inner, lobes, amplitude, points,
-                           stroke_w, stroke_color, opacity, band_spacing):
+                           stroke_w, stroke_color, opacity, band_spacing, rot_deg=0.0):
     """Draw a filled guilloché 'field' by stacking rosette bands from inner to outer radius.
 
     This approximates engine-turned full-dial textures (e.g., barleycorn / rosette fields)
@@ -233,26 +261,11 @@ def pattern_guilloche_field(svg, g, cx, cy, r_outer, r_inner, lobes, amplitude,
     r = max(0.0, float(r_inner)) + amplitude
     bands = 0
     max_bands = 600  # safety against accidental huge docs / tiny spacing
+    style_str = stroke_style(stroke_color, stroke_w, opacity, "stroke-linejoin:round")
     while r <= r_outer + 1e-9 and bands < max_bands:
         base = r
-        pts = []
-        for i in range(points + 1):
-            t = (2.0 * math.pi) * (i / points)
-            rr = base + amplitude * math.cos(lobes * t)
-            ang_deg = math.degrees(t)
-            x, y = polar(cx, cy, rr, ang_deg)
-            pts.append((x, y))
-
-        d = f"M {pts[0][0]:.6f},{pts[0][1]:.6f} " + " ".join([f"L {x:.6f},{y:.6f}" for x, y in pts[1:]])
-        p = new_path(d)
-        set_style(p, {
-            "fill": "none",
-            "stroke": stroke_color,
-            "stroke-width": str(stroke_w),
-            "stroke-opacity": str(opacity),
-            "stroke-linejoin": "round",
-        })
-        g.add(p) if hasattr(g, 'add') else g.append(p)
+        d = polyline_d(*rosette_xy(cx, cy, base, amplitude, lobes, points, rot_deg))
+        add_path(g, d, style_str)
 
         r += band_spacing
         bands += 1
@@ -314,44 +327,51 @@ class DialPatternGenerator(inkex.EffectExtension):
 
         pars.add_argument("--group_name", type=str, default="dial-pattern")
 
-    def _draw_one(self, svg, layer_g, cx, cy, r_outer, r_inner, ptype, stroke_w, stroke_color, opacity, overrides):
+    def _draw_one(self, svg, layer_g, cx, cy, r_outer, r_inner, ptype, stroke_w, stroke_color, opacity, overrides,
+                  rot_deg=0.0):
         # overrides dict may include: ring_spacing, rays, lobes, amplitude, points, hatch_spacing, hatch_angle, hatch_double
+        # rot_deg turns the pattern about (cx, cy); it is baked into the coordinates (rings are unaffected)
         if ptype == "concentric":
-            spacing = overrides.get("ring_spacing", mm_to_uu(svg, self.options.ring_spacing_mm))
+            spacing = overrides.get("ring_spacing", self.options.ring_spacing_mm * self._mm_scale)
             pattern_concentric(svg, layer_g, cx, cy, r_outer, r_inner, spacing, stroke_w, stroke_color, opacity)
         elif ptype == "sunburst":
             rays = overrides.get("rays", self.options.rays)
-            pattern_sunburst(svg, layer_g, cx, cy, r_outer, r_inner, rays, stroke_w, stroke_color, opacity)
+            pattern_sunburst(svg, layer_g, cx, cy, r_outer, r_inner, rays, stroke_w, stroke_color, opacity,
+                             clipped=bool(self.options.clip_to_circle), rot_deg=rot_deg)
         elif ptype == "crosshatch":
-            hs = overrides.get("hatch_spacing", mm_to_uu(svg, self.options.hatch_spacing_mm))
+            hs = overrides.get("hatch_spacing", self.options.hatch_spacing_mm * self._mm_scale)
             ha = overrides.get("hatch_angle", self.options.hatch_angle_deg)
             hd = overrides.get("hatch_double", bool(self.options.hatch_double))
-            pattern_crosshatch(svg, layer_g, cx, cy, r_outer, hs, ha, hd, stroke_w, stroke_color, opacity)
+            pattern_crosshatch(svg, layer_g, cx, cy, r_outer, hs, ha, hd, stroke_w, stroke_color, opacity,
+                               clipped=bool(self.options.clip_to_circle), rot_deg=rot_deg)
         else:
             lobes = overrides.get("lobes", self.options.lobes)
-            amp = overrides.get("amplitude", mm_to_uu(svg, self.options.amplitude_mm))
+            amp = overrides.get("amplitude", self.options.amplitude_mm * self._mm_scale)
             pts = overrides.get("points", self.options.points)
             if bool(getattr(self.options, "guilloche_fill", False)):
-                bs = mm_to_uu(svg, float(getattr(self.options, "band_spacing_mm", 0.35)))
-                pattern_guilloche_field(svg, layer_g, cx, cy, r_outer, r_inner, lobes, amp, pts, stroke_w, stroke_color, opacity, bs)
+                bs = float(getattr(self.options, "band_spacing_mm", 0.35)) * self._mm_scale
+                pattern_guilloche_field(svg, layer_g, cx, cy, r_outer, r_inner, lobes, amp, pts, stroke_w, stroke_color, opacity, bs,
+                                        rot_deg=rot_deg)
             else:
-                pattern_guilloche(svg, layer_g, cx, cy, r_outer, lobes, amp, pts, stroke_w, stroke_color, opacity)
+                pattern_guilloche(svg, layer_g, cx, cy, r_outer, lobes, amp, pts, stroke_w, stroke_color, opacity,
+                                  rot_deg=rot_deg)
 
     def effect(self):
         svg = self.document.getroot()
         cx, cy = get_doc_center(svg)
+        # mm -> user units, queried once; _draw_one reads it back from self
+        mm = self._mm_scale = uu_per_mm(svg)
 
         # Radii
         outline_w_mm = self.options.outline_stroke_mm
         dial_r_mm = (self.options.dial_diameter_mm - (outline_w_mm if self.options.outline_compensate_stroke else 0.0)) / 2.0
-        r_outer = mm_to_uu(svg, dial_r_mm)
-        r_inner = mm_to_uu(svg, max(0.0, self.options.inner_radius_mm))
+        r_outer = dial_r_mm * mm
+        r_inner = max(0.0, self.options.inner_radius_mm) * mm
 
         # Root group
         g = Group()
         g.label = self.options.group_name or "dial-pattern"
         g.set("id", self.options.group_name or "dial-pattern")
-        svg.add(g)
 
         # Pattern group (clipped)
         pattern_g = Group()
@@ -360,10 +380,10 @@ class DialPatternGenerator(inkex.EffectExtension):
         g.add(pattern_g)
 
         if self.options.clip_to_circle:
-            clip_id = (g.get("id") + "-clip-" + uuid.uuid4().hex[:6])
+            clip_id = seeded_id(svg, g.get("id") + "-clip-", int(self.options.seed))
             clip_group_to_circle(svg, pattern_g, cx, cy, r_outer, clip_id)
 
-        base_stroke = mm_to_uu(svg, self.options.stroke_mm)
+        base_stroke = self.options.stroke_mm * mm
         base_opacity = float(self.options.stroke_opacity)
         stroke_color = self.options.stroke_color
 
@@ -382,14 +402,11 @@ class DialPatternGenerator(inkex.EffectExtension):
             layers = max(1, int(self.options.layers))
             preset = (self.options.complex_preset or "rosette_stack").strip().lower()
 
-            # helper to create a layer group with optional rotation
-            def make_layer(idx, rotate_deg):
+            # helper to create a (still detached) layer group; rotation is baked into the geometry
+            def make_layer(idx):
                 lg = Group()
                 lg.label = f"layer-{idx+1}"
                 lg.set("id", f"{pattern_g.get('id')}-layer-{idx+1}")
-                if abs(rotate_deg) > 1e-9:
-                    lg.set("transform", f"rotate({rotate_deg:.6f},{cx},{cy})")
-                pattern_g.add(lg)
                 return lg
 
             # Preset definitions as a list of (ptype, overrides_fn(idx)->dict)
@@ -398,19 +415,19 @@ class DialPatternGenerator(inkex.EffectExtension):
             if preset == "breguet":
                 # subtle rings + rosette + faint sunburst + fine rosette
                 plan = [
-                    ("concentric", lambda i: {"ring_spacing": mm_to_uu(svg, 0.45)}),
-                    ("guilloche",  lambda i: {"lobes": 12 + rnd.randint(-2, 2), "amplitude": mm_to_uu(svg, 1.0), "points": max(1600, int(self.options.points))}),
+                    ("concentric", lambda i: {"ring_spacing": 0.45 * mm}),
+                    ("guilloche",  lambda i: {"lobes": 12 + rnd.randint(-2, 2), "amplitude": 1.0 * mm, "points": max(1600, int(self.options.points))}),
                     ("sunburst",   lambda i: {"rays": 240}),
-                    ("guilloche",  lambda i: {"lobes": 36 + rnd.randint(-6, 6), "amplitude": mm_to_uu(svg, 0.28), "points": max(2400, int(self.options.points))}),
+                    ("guilloche",  lambda i: {"lobes": 36 + rnd.randint(-6, 6), "amplitude": 0.28 * mm, "points": max(2400, int(self.options.points))}),
                 ]
                 layers = max(layers, 4)
             elif preset == "modern":
                 # sunburst shimmer + crosshatch texture + rosette structure + fine rosette
                 plan = [
                     ("sunburst",   lambda i: {"rays": 300}),
-                    ("crosshatch", lambda i: {"hatch_spacing": mm_to_uu(svg, 0.6), "hatch_angle": 35.0, "hatch_double": True}),
-                    ("guilloche",  lambda i: {"lobes": 18 + rnd.randint(-3, 3), "amplitude": mm_to_uu(svg, 0.75), "points": max(2000, int(self.options.points))}),
-                    ("guilloche",  lambda i: {"lobes": 48 + rnd.randint(-8, 8), "amplitude": mm_to_uu(svg, 0.22), "points": max(3000, int(self.options.points))}),
+                    ("crosshatch", lambda i: {"hatch_spacing": 0.6 * mm, "hatch_angle": 35.0, "hatch_double": True}),
+                    ("guilloche",  lambda i: {"lobes": 18 + rnd.randint(-3, 3), "amplitude": 0.75 * mm, "points": max(2000, int(self.options.points))}),
+                    ("guilloche",  lambda i: {"lobes": 48 + rnd.randint(-8, 8), "amplitude": 0.22 * mm, "points": max(3000, int(self.options.points))}),
                 ]
                 layers = max(layers, 4)
             elif preset == "pocketwatch":
@@ -420,6 +437,12 @@ class DialPatternGenerator(inkex.EffectExtension):
                 # rosette_stack
                 plan = [("guilloche", lambda i: {})] * layers
 
+            # per-layer decay factors, advanced by one multiply per layer (decay ** i)
+            stroke_decay = float(self.options.stroke_decay)
+            opacity_decay = float(self.options.opacity_decay)
+            amp_decay = float(self.options.amp_decay)
+            sw_cur, op_cur, amp_k = base_stroke, base_opacity, 1.0
+
             for i in range(layers):
                 # pick pattern type / overrides
                 ptype, ofn = plan[i % len(plan)]
@@ -428,13 +451,13 @@ class DialPatternGenerator(inkex.EffectExtension):
                 # vary rosette parameters if not explicitly set by preset
                 if ptype == "guilloche":
                     base_lobes = overrides.get("lobes", int(self.options.lobes))
-                    base_amp = overrides.get("amplitude", mm_to_uu(svg, self.options.amplitude_mm))
+                    base_amp = overrides.get("amplitude", self.options.amplitude_mm * mm)
                     # jitter lobes unless preset already tightly set via overrides
                     if "lobes" not in overrides:
                         base_lobes = max(2, base_lobes + rnd.randint(-int(self.options.lobe_jitter), int(self.options.lobe_jitter)))
                         overrides["lobes"] = base_lobes
                     if "amplitude" not in overrides:
-                        overrides["amplitude"] = base_amp * (float(self.options.amp_decay) ** i)
+                        overrides["amplitude"] = base_amp * amp_k
                     if "points" not in overrides:
                         # more points on top layers reads as "engraving-grade"
                         p0 = int(self.options.points)
@@ -446,30 +469,33 @@ class DialPatternGenerator(inkex.EffectExtension):
                         overrides["hatch_angle"] = float(self.options.hatch_angle_deg) + rnd.uniform(-5.0, 5.0)
 
                 # compute per-layer stroke/opacity
-                sw = base_stroke * (float(self.options.stroke_decay) ** i)
-                op = base_opacity * (float(self.options.opacity_decay) ** i)
-                op = max(0.02, min(1.0, op))
+                sw = sw_cur
+                op = max(0.02, min(1.0, op_cur))
 
                 # rotation jitter
                 rot = rnd.uniform(-float(self.options.rotate_jitter_deg), float(self.options.rotate_jitter_deg))
-                lg = make_layer(i, rot)
+                lg = make_layer(i)
 
-                self._draw_one(svg, lg, cx, cy, r_outer, r_inner, ptype, sw, stroke_color, op, overrides)
+                self._draw_one(svg, lg, cx, cy, r_outer, r_inner, ptype, sw, stroke_color, op, overrides, rot_deg=rot)
+                pattern_g.add(lg)
+
+                sw_cur *= stroke_decay
+                op_cur *= opacity_decay
+                amp_k *= amp_decay
 
         # Outline on top
         if self.options.draw_outline:
-            stroke_outline = mm_to_uu(svg, outline_w_mm)
+            stroke_outline = outline_w_mm * mm
             c = Circle()
             c.set('cx', str(cx))
             c.set('cy', str(cy))
             c.set('r', str(r_outer))
-            set_style(c, {
-                "fill": "none",
-                "stroke": "#000000",
-                "stroke-width": str(stroke_outline),
-            })
+            c.attrib['style'] = "fill:none;stroke:#000000;stroke-width:%s" % stroke_outline
             g.add(c)
 
+        # Everything above was built off-tree; attach it in a single insert
+        svg.add(g)
+
 
 if __name__ == "__main__":
     DialPatternGenerator().run()
\ No newline at end of file